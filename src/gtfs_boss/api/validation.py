@@ -1,35 +1,184 @@
 import logging
-import traceback
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Request, UploadFile, File, HTTPException
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, Any
+from collections import OrderedDict
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import shutil
 import tempfile
+import threading
 import os
 import gtfs_kit as gk
+import numpy as np
 import pandas as pd # Import pandas for DataFrame checks
 from ..core.validator import GTFSValidator
 from ..core.report_generator import GTFSReportGenerator
-from io import StringIO
-from ..realtime.processor import fetch_and_parse_realtime_feed
-import shutil
-import json # Import json for GeoJSON response
+from ..realtime.processor import fetch_and_parse_realtime_feed_async
+import orjson
 from ..utils.download_feed import download_gtfs_feed
 from pathlib import Path # Import Path
 import time # Import time for timestamp handling
 
 router = APIRouter()
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse that renders with orjson instead of stdlib json.
+
+    orjson's C encoder is several times faster on the large nested payloads
+    this API returns (vehicles, GeoJSON, reports) and serializes numpy
+    scalars natively, so pandas-derived values don't need casting first.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
 # Global variable to store the last validated feed object
 last_validated_feed: Optional[gk.Feed] = None
 
 # Define the directory for storing uploaded feeds using relative path
 UPLOAD_DIR = Path("data/uploaded_feeds")
 
+# Cache of (validation_results, report) keyed by the persisted feed's mtime+size,
+# so /report can return the memoized result instead of re-running validation
+# when current_feed.zip hasn't changed.
+_report_cache: dict[str, tuple[dict, dict]] = {}
+# Lazily populated CSV exports, keyed the same way.
+_csv_cache: dict[str, str] = {}
+
+# Pre-serialized route-geometry GeoJSON, keyed by id() of the feed it was
+# built from. The feed object is immutable between uploads, so the bytes can
+# be served as-is until /validate swaps the feed out.
+_geojson_cache: Optional[tuple[int, bytes]] = None
+
+# Small LRU of parsed feeds keyed by SHA-256 of the ZIP contents, so
+# re-uploading an identical feed (or flipping between a handful of feeds
+# under test) skips the multi-second gk.read_feed parse entirely.
+FEED_CACHE_SIZE = 4
+_feed_cache: "OrderedDict[str, gk.Feed]" = OrderedDict()
+_feed_cache_lock = threading.RLock()
+
+def _feed_cache_get(digest: str) -> Optional[gk.Feed]:
+    """Return the cached feed for this digest, refreshing its LRU position."""
+    with _feed_cache_lock:
+        feed = _feed_cache.get(digest)
+        if feed is not None:
+            _feed_cache.move_to_end(digest)
+        return feed
+
+def _feed_cache_put(digest: str, feed: gk.Feed) -> None:
+    """Insert a parsed feed, evicting the least recently used entry if full."""
+    with _feed_cache_lock:
+        _feed_cache[digest] = feed
+        _feed_cache.move_to_end(digest)
+        while len(_feed_cache) > FEED_CACHE_SIZE:
+            _feed_cache.popitem(last=False)
+
+# GTFS tables persisted as parquet alongside current_feed.zip. Parquet is
+# columnar and typed, so rebuilding the feed from it on startup is an order
+# of magnitude faster than re-parsing the CSVs inside the ZIP.
+_PARQUET_TABLES = ('agency', 'stops', 'routes', 'trips', 'stop_times', 'calendar',
+                   'calendar_dates', 'shapes', 'frequencies', 'transfers',
+                   'pathways', 'levels', 'fare_attributes', 'feed_info')
+_PARQUET_DIR = UPLOAD_DIR / "parquet_cache"
+
+def _write_parquet_cache(feed: gk.Feed) -> None:
+    """Persist the feed's DataFrames as parquet so the next startup can skip read_feed."""
+    # Write into a sibling temp directory and swap the complete set into
+    # place, so a to_parquet failure partway through can never leave a
+    # partial cache for the reader to accept as a whole feed
+    tmp_dir = _PARQUET_DIR.with_name(_PARQUET_DIR.name + ".tmp")
+    try:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+        for name in _PARQUET_TABLES:
+            df = getattr(feed, name, None)
+            # Empty tables are persisted too: the validation worker rebuilds
+            # the feed from this cache, and a present-but-empty required
+            # file must still be reported as empty, not missing
+            if isinstance(df, pd.DataFrame):
+                df.to_parquet(tmp_dir / f"{name}.parquet")
+        if _PARQUET_DIR.exists():
+            shutil.rmtree(_PARQUET_DIR)
+        os.replace(tmp_dir, _PARQUET_DIR)
+    except Exception:
+        logger.exception("Failed to write parquet cache; next startup will re-parse the ZIP")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def _read_parquet_cache(zip_path: Path) -> Optional[gk.Feed]:
+    """Rebuild the feed from the parquet cache, or return None if it's missing or stale."""
+    try:
+        files = [f for f in _PARQUET_DIR.glob('*.parquet') if f.stem in _PARQUET_TABLES]
+        if not files:
+            return None
+        zip_mtime = zip_path.stat().st_mtime
+        if any(f.stat().st_mtime < zip_mtime for f in files):
+            # The ZIP was replaced after the cache was written
+            return None
+        tables = {f.stem: pd.read_parquet(f) for f in files}
+        return gk.Feed(dist_units='km', **tables)
+    except Exception:
+        logger.exception("Failed to load parquet cache; falling back to read_feed")
+        return None
+
+# Pool of worker processes for validation/report generation. These are
+# CPU-bound pandas workloads, so a thread would still serialize on the GIL;
+# separate processes let concurrent uploads use multiple cores. Created
+# lazily so importing the module never forks.
+_validation_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+def _get_validation_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _validation_pool
+    if _validation_pool is None:
+        _validation_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _validation_pool
+
+def _validation_worker(feed_path: str) -> tuple[dict, dict]:
+    """
+    Validate a feed and build its report in a worker process.
+
+    Takes the feed path rather than the Feed object so only the small result
+    dicts cross the process boundary; the worker reloads the feed from the
+    parquet cache when available instead of re-parsing the ZIP.
+    """
+    feed = _read_parquet_cache(Path(feed_path))
+    if feed is None:
+        feed = gk.read_feed(feed_path, dist_units='km')
+    validation_results = GTFSValidator().validate_feed(feed)
+    report = GTFSReportGenerator(feed).generate_report(validation_results)
+    return validation_results, report
+
+def _hash_feed_file(path: Path) -> str:
+    """Stream a feed ZIP through SHA-256 in 1 MiB chunks and return the digest."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        while chunk := fh.read(1 << 20):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _feed_cache_key(path: Path) -> Optional[str]:
+    """Build a cache key from the feed file's mtime and size, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+def _store_report_cache(cache_key: Optional[str], validation_results: dict, report: dict) -> None:
+    """Replace the cached report for the current feed (only one feed is persisted at a time)."""
+    if cache_key is None:
+        return
+    _report_cache.clear()
+    _csv_cache.clear()
+    _report_cache[cache_key] = (validation_results, report)
+
 # Ensure the upload directory exists on startup
 @router.on_event("startup")
 async def startup_event():
@@ -39,14 +188,23 @@ async def startup_event():
     if persistent_feed_path.exists():
         try:
             global last_validated_feed
-            feed = gk.read_feed(str(persistent_feed_path), dist_units='km')
+            # Prefer the parquet cache; fall back to parsing the ZIP and
+            # write the cache so the next startup is fast
+            feed = _read_parquet_cache(persistent_feed_path)
+            if feed is None:
+                feed = gk.read_feed(str(persistent_feed_path), dist_units='km')
+                if feed is not None:
+                    _write_parquet_cache(feed)
             if feed is not None:
                 last_validated_feed = feed
+                # Register the feed under its content digest so the first
+                # re-upload of the same ZIP after a restart is a cache hit
+                _feed_cache_put(_hash_feed_file(persistent_feed_path), feed)
                 # logger.info(f"Loaded persistent feed from {persistent_feed_path}") # Reduced log
             else:
-                 logger.warning(f"Failed to read persistent feed from {persistent_feed_path}")
+                 logger.warning("Failed to read persistent feed from %s", persistent_feed_path)
         except Exception as e:
-            logger.error(f"Error loading persistent feed on startup: {e}")
+            logger.exception("Error loading persistent feed on startup")
 
 # Add CORS middleware to this router if it were standalone, but we add it to the main app
 # router.add_middleware(
@@ -59,6 +217,7 @@ async def startup_event():
 
 @router.post("/validate")
 async def validate_gtfs(
+    request: Request,
     file: UploadFile = File(...),
     format: str = "json"
 ) -> Any:
@@ -70,63 +229,105 @@ async def validate_gtfs(
     persistent_feed_path = UPLOAD_DIR / "current_feed.zip"
     global last_validated_feed # Declare use of global variable
     try:
-        # Save uploaded file temporarily
-        # Use a more robust temporary file handling with a known suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as temp_file:
-             content = await file.read()
-             temp_file.write(content)
-             temp_file_path = Path(temp_file.name)
-
-        # Read and validate the feed
+        # Stream the upload once, in 1 MiB chunks, into a per-request temp
+        # file next to its final location (same filesystem, so the promote
+        # below stays an atomic rename). The unique name matters: a fixed
+        # temp path would let two concurrent uploads interleave writes into
+        # one corrupt ZIP. The single copy on disk is renamed into place
+        # only after the feed parses, so a bad upload never clobbers the
+        # persisted feed and the ZIP is written exactly once.
+        temp_fd, temp_name = tempfile.mkstemp(dir=UPLOAD_DIR, suffix='.tmp')
+        temp_file_path = Path(temp_name)
+        hasher = hashlib.sha256()
+        with os.fdopen(temp_fd, 'wb') as temp_file:
+            while chunk := await file.read(1 << 20):
+                hasher.update(chunk)
+                temp_file.write(chunk)
+        feed_digest = hasher.hexdigest()
+        etag = f'"{feed_digest}"'
+
+        # If the client already holds results for this exact content (the
+        # digest doubles as the ETag) and it is the feed every other
+        # endpoint currently serves, nothing changed — answer 304 without
+        # re-validating. The identity check matters: a cached-but-not-
+        # current feed must take the full path below so the upload is
+        # promoted and /report and the geometry endpoints switch to it.
+        if request.headers.get("if-none-match") == etag:
+            cached_feed = _feed_cache_get(feed_digest)
+            if cached_feed is not None and cached_feed is last_validated_feed:
+                return Response(status_code=304, headers={"ETag": etag})
+
+        # Read and validate the feed. The parse/validate/report steps are
+        # blocking pandas work, so run them in a worker thread to keep the
+        # event loop free for concurrent requests. A ZIP we have already
+        # parsed (by content hash) is served straight from the feed cache.
         try:
-            feed = gk.read_feed(str(temp_file_path), dist_units='km')
+            feed = _feed_cache_get(feed_digest)
             if feed is None:
-                logger.error("gtfs_kit.read_feed returned None")
-                raise HTTPException(status_code=400, detail="Failed to read GTFS feed: Feed is None")
-
-            # Store the successfully loaded feed in the global variable
+                feed = await asyncio.to_thread(gk.read_feed, str(temp_file_path), dist_units='km')
+                if feed is None:
+                    logger.error("gtfs_kit.read_feed returned None")
+                    raise HTTPException(status_code=400, detail="Failed to read GTFS feed: Feed is None")
+                _feed_cache_put(feed_digest, feed)
+
+            # Store the successfully loaded feed in the global variable and
+            # drop any GeoJSON serialized from the previous feed
             last_validated_feed = feed
-
-            # Save the uploaded file to the persistent storage location
-            shutil.copy(temp_file_path, persistent_feed_path)
-            # logger.info(f"Saved uploaded feed to {persistent_feed_path}") # Reduced log
-
-            validator = GTFSValidator()
-            validation_results = validator.validate_feed(feed)
-
-            # Generate report
+            global _geojson_cache
+            _geojson_cache = None
+
+            # Promote the upload to the persistent feed location atomically
+            # and refresh the parquet cache used for fast startup
+            os.replace(temp_file_path, persistent_feed_path)
+            temp_file_path = None
+            await asyncio.to_thread(_write_parquet_cache, feed)
+
+            # Validate and build the report in a worker process so concurrent
+            # uploads parallelize across cores instead of contending on this
+            # process's GIL
             try:
+                loop = asyncio.get_running_loop()
+                validation_results, report = await loop.run_in_executor(
+                    _get_validation_pool(), _validation_worker, str(persistent_feed_path))
                 report_generator = GTFSReportGenerator(feed)
-                report = report_generator.generate_report(validation_results)
+
+                # Cache the results so /report doesn't have to re-run validation
+                _store_report_cache(_feed_cache_key(persistent_feed_path), validation_results, report)
 
                 # Return results in requested format
                 if format.lower() == "csv":
-                    csv_content = report_generator.export_csv(report)
+                    # Stream the export row by row rather than building the
+                    # whole CSV string in memory first
                     return StreamingResponse(
-                        iter([csv_content]),
+                        report_generator.iter_csv_rows(report),
                         media_type="text/csv",
                         headers={"Content-Disposition": f"attachment; filename=validation_report.csv"}
                     )
 
-                # Return validation results in the format expected by the frontend
-                return {
-                    "is_valid": validation_results["is_valid"],
-                    "errors": validation_results["errors"],
-                    "warnings": validation_results["warnings"],
-                    "feed_info": report["feed_info"],
-                    "metrics": report["metrics"],
-                    "summary": report["summary"]
-                }
+                # Return validation results in the format expected by the
+                # frontend, tagged with the content digest so clients can
+                # revalidate cheaply via If-None-Match
+                return ORJSONResponse(
+                    content={
+                        "is_valid": validation_results["is_valid"],
+                        "errors": validation_results["errors"],
+                        "warnings": validation_results["warnings"],
+                        "feed_info": report["feed_info"],
+                        "metrics": report["metrics"],
+                        "summary": report["summary"]
+                    },
+                    headers={"ETag": etag}
+                )
             except ValueError as e:
                 raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
         except Exception as e:
             # Log the full traceback for better debugging
-            logger.error(f"An error occurred during GTFS validation: {e}\n{traceback.format_exc()}")
+            logger.exception("An error occurred during GTFS validation")
             raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
 
     except Exception as e:
-        logger.error(f"An error occurred during file processing: {e}\n{traceback.format_exc()}")
+        logger.exception("An error occurred during file processing")
         raise HTTPException(status_code=500, detail=f"File processing failed: {str(e)}")
 
     finally:
@@ -134,11 +335,89 @@ async def validate_gtfs(
         if temp_file_path and temp_file_path.exists():
             os.unlink(temp_file_path)
 
+def _translated_text(alert: dict, key: str) -> Optional[str]:
+    """
+    Extract the first translation's text from a GTFS-RT TranslatedString field.
+
+    Specialized for the exact shape these feeds use, without the throwaway
+    {} and [{}] defaults the chained dict.get version allocated per field.
+    """
+    value = alert.get(key)
+    if not value:
+        return None
+    translations = value.get('translation')
+    if not translations:
+        return None
+    return translations[0].get('text')
+
+@functools.lru_cache(maxsize=None)
+def _normalize_route_color(route_color: Optional[str]) -> str:
+    """Normalize a GTFS route_color value to a #RRGGBB hex string, defaulting to black."""
+    if not route_color:
+        return "#000000"
+    # Remove any existing # prefix; only accept 6-character hex values
+    route_color = str(route_color).strip('#')
+    return f"#{route_color}" if len(route_color) == 6 else "#000000"
+
+def iter_shape_coordinates(shapes_df):
+    """
+    Yield (shape_id, coordinates) pairs for each shape, with coordinates as
+    [[lon, lat], ...] ordered by shape_pt_sequence.
+
+    Sorts the whole shapes table once and slices each shape's points out of the
+    underlying numpy arrays, instead of sorting and iterating row-by-row per group.
+    """
+    shapes_sorted = shapes_df.sort_values(['shape_id', 'shape_pt_sequence'], kind='mergesort')
+    ids = shapes_sorted['shape_id'].to_numpy()
+    coords = np.column_stack([
+        shapes_sorted['shape_pt_lon'].to_numpy(),
+        shapes_sorted['shape_pt_lat'].to_numpy()
+    ])
+    # Boundaries where shape_id changes mark the start of each new shape's points
+    boundaries = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    for start, group in zip(starts, np.split(coords, boundaries)):
+        # Tuples are cheaper to allocate than per-point lists and orjson
+        # serializes them as JSON arrays just the same
+        yield ids[start], list(map(tuple, group.tolist()))
+
+# On-time window in seconds for schedule-adherence classification
+ON_TIME_EARLY_THRESHOLD = -60
+ON_TIME_LATE_THRESHOLD = 300
+
+def classify_deviations(devs: np.ndarray) -> tuple[int, int, int, float, float, float]:
+    """
+    Classify schedule deviations against the on-time window in one pass.
+
+    Args:
+        devs: float64 array of deviations in seconds, NaN where no deviation
+              was reported.
+
+    Returns:
+        (n_on_time, n_early, n_late, sum_early_abs, sum_late, sum_all) over
+        the reported (non-NaN) deviations.
+    """
+    reported = devs[~np.isnan(devs)]
+    early_mask = reported < ON_TIME_EARLY_THRESHOLD
+    late_mask = reported > ON_TIME_LATE_THRESHOLD
+    n_early = int(np.count_nonzero(early_mask))
+    n_late = int(np.count_nonzero(late_mask))
+    n_on_time = int(reported.size) - n_early - n_late
+    sum_early_abs = float(np.abs(reported[early_mask]).sum())
+    sum_late = float(reported[late_mask].sum())
+    sum_all = float(reported.sum())
+    return n_on_time, n_early, n_late, sum_early_abs, sum_late, sum_all
+
 def get_time_seconds(time_str):
     """Converts HH:MM:SS time string to seconds since midnight."""
     if pd.isna(time_str):
         return None
     try:
+        # Fast path for the standard fixed-width HH:MM:SS format: slice the
+        # digits directly instead of allocating a split list per call.
+        if len(time_str) == 8 and time_str[2] == ':' and time_str[5] == ':':
+            return int(time_str[0:2]) * 3600 + int(time_str[3:5]) * 60 + int(time_str[6:8])
+
         # Split into hours, minutes, seconds
         parts = list(map(int, time_str.split(':')))
         if len(parts) == 3:
@@ -147,16 +426,26 @@ def get_time_seconds(time_str):
              h, m = parts
              s = 0
         else:
-             logger.warning(f"Unexpected time format: {time_str}")
+             logger.warning("Unexpected time format: %s", time_str)
              return None
         return h * 3600 + m * 60 + s
     except ValueError:
-        logger.warning(f"Could not parse time string to int: {time_str}")
+        logger.warning("Could not parse time string to int: %s", time_str)
         return None
     except Exception as e:
-        logger.error(f"Error in get_time_seconds for {time_str}: {e}")
+        logger.error("Error in get_time_seconds for %s: %s", time_str, e)
         return None
 
+def get_time_seconds_series(times: pd.Series) -> pd.Series:
+    """
+    Vectorized counterpart to get_time_seconds for whole columns.
+
+    Converts a Series of GTFS time strings to seconds since midnight in one
+    C-level pass; unparseable values become NaN. Prefer this over applying
+    get_time_seconds row by row.
+    """
+    return pd.to_timedelta(times, errors='coerce').dt.total_seconds()
+
 @router.get("/realtime/vehicles")
 async def get_realtime_vehicles():
     """
@@ -169,178 +458,129 @@ async def get_realtime_vehicles():
         trip_updates_url = "https://mna.mecatran.com/utw/ws/gtfsfeed/realtime/valleymetro?apiKey=4f22263f69671d7f49726c3011333e527368211f&asJson=true"
         service_alerts_url = "https://mna.mecatran.com/utw/ws/gtfsfeed/alerts/valleymetro?apiKey=4f22263f69671d7f49726c3011333e527368211f&asJson=true"
 
-        # Fetch and parse the Vehicle Positions feed
-        vehicle_positions_data = fetch_and_parse_realtime_feed(vehicle_positions_url)
+        # Fetch and parse the three feeds concurrently; wall time is then the
+        # slowest single round-trip instead of the sum of all three.
+        vehicle_positions_data, trip_updates_data, service_alerts_data = await asyncio.gather(
+            fetch_and_parse_realtime_feed_async(vehicle_positions_url),
+            fetch_and_parse_realtime_feed_async(trip_updates_url),
+            fetch_and_parse_realtime_feed_async(service_alerts_url)
+        )
         if vehicle_positions_data is None:
-            logger.error("fetch_and_parse_realtime_feed for vehicle positions returned None")
+            logger.error("fetch_and_parse_realtime_feed_async for vehicle positions returned None")
             raise HTTPException(status_code=500, detail="Failed to fetch or parse real-time vehicle position data")
-
-        # Fetch and parse the Trip Updates feed
-        trip_updates_data = fetch_and_parse_realtime_feed(trip_updates_url)
         if trip_updates_data is None:
-            logger.error("fetch_and_parse_realtime_feed for trip updates returned None")
+            logger.error("fetch_and_parse_realtime_feed_async for trip updates returned None")
             raise HTTPException(status_code=500, detail="Failed to fetch or parse real-time trip update data")
-
-        # Fetch and parse the Service Alerts feed
-        service_alerts_data = fetch_and_parse_realtime_feed(service_alerts_url)
         if service_alerts_data is None:
-            logger.error("fetch_and_parse_realtime_feed for service alerts returned None")
+            logger.error("fetch_and_parse_realtime_feed_async for service alerts returned None")
             raise HTTPException(status_code=500, detail="Failed to fetch or parse real-time service alert data")
 
         # Use the timestamp from the vehicle positions feed for consistency
         realtime_timestamp = vehicle_positions_data.get('header', {}).get('timestamp')
 
+        # --- Extract Schedule Deviations from Trip Updates ---
+        trip_deviations = {} # Map trip_id to deviation
+        if 'entity' in trip_updates_data:
+            # Flatten all stop time updates into (trip_id, stop_sequence, deviation) rows,
+            # preferring scheduleDeviation over arrival/departure delay, then let pandas
+            # pick the latest-sequence deviation per trip in one vectorized groupby
+            # instead of sorting and re-iterating each stopTimeUpdate list in Python.
+            deviation_rows = [
+                (
+                    trip_update.get('trip', {}).get('tripId'),
+                    stop_time_update.get('stopSequence', 0),
+                    stop_time_update.get('scheduleDeviation',
+                                         stop_time_update.get('arrival', {}).get('delay',
+                                         stop_time_update.get('departure', {}).get('delay')))
+                )
+                for entity in trip_updates_data['entity']
+                if 'tripUpdate' in entity
+                for trip_update in (entity['tripUpdate'],)
+                for stop_time_update in trip_update.get('stopTimeUpdate', [])
+            ]
+
+            if deviation_rows:
+                deviations_df = pd.DataFrame(deviation_rows, columns=['trip_id', 'stop_sequence', 'deviation'])
+                # Coerce non-numeric deviations to NaN and drop them (replaces per-row int() try/except)
+                deviations_df['deviation'] = pd.to_numeric(deviations_df['deviation'], errors='coerce')
+                deviations_df = deviations_df.dropna(subset=['trip_id', 'deviation'])
+                if not deviations_df.empty:
+                    latest = deviations_df.loc[deviations_df.groupby('trip_id')['stop_sequence'].idxmax()]
+                    # tolist() gives plain Python ints for the vehicle dicts
+                    trip_deviations = dict(zip(latest['trip_id'], latest['deviation'].astype(int).tolist()))
+        else:
+            logger.warning("'entity' key not found in trip_updates_data or is empty.")
+
+
         # --- Extract Vehicle Positions ---
+        # Deviations are looked up while each vehicle dict is built, so every
+        # vehicle is touched exactly once; the classification kernel then
+        # consumes the deviation array without any re-scan of the dicts.
         vehicle_positions = []
+        deviation_values = [] # One float per vehicle, NaN when unreported
         if 'entity' in vehicle_positions_data:
             # logger.info(f"Found {len(vehicle_positions_data.get('entity', []))} entities in Vehicle Positions feed.") # Reduced log
             for entity in vehicle_positions_data['entity']:
-                if 'vehicle' in entity:
-                    vehicle = entity['vehicle']
-                    vehicle_id = vehicle.get('vehicle', {}).get('id')
-                    vehicle_label = vehicle.get('vehicle', {}).get('label')
-                    position = vehicle.get('position', {})
-                    latitude = position.get('latitude')
-                    longitude = position.get('longitude')
-                    bearing = position.get('bearing')
-                    speed = position.get('speed')
-                    current_status = vehicle.get('currentStatus')
-                    stop_id = vehicle.get('stopId')
-                    trip_info = vehicle.get('trip', {})
-                    trip_id = trip_info.get('tripId')
-                    route_id = trip_info.get('routeId')
-                    direction_id = trip_info.get('directionId')
-                    congestion_level = vehicle.get('congestionLevel')
-                    occupancy_status = vehicle.get('occupancyStatus')
-
-                    # Only process vehicle if required position data and trip_id are available
-                    if latitude is not None and longitude is not None and trip_id is not None:
-                        vehicle_positions.append({
-                            'id': vehicle_id,
-                            'label': vehicle_label,
-                            'position': {
-                                'latitude': latitude,
-                                'longitude': longitude,
-                                'bearing': bearing,
-                                'speed': speed
-                            },
-                            'currentStatus': current_status,
-                            'stopId': stop_id,
-                            'congestionLevel': congestion_level,
-                            'occupancyStatus': occupancy_status,
-                            'trip': {
-                                'tripId': trip_id,
-                                'routeId': route_id,
-                                'directionId': direction_id
-                            },
-                            'scheduleDeviation': None # Will be populated from trip updates
-                        })
+                vehicle = entity.get('vehicle')
+                if vehicle is None:
+                    continue
+                position = vehicle.get('position', {})
+                trip_info = vehicle.get('trip', {})
+
+                # Reject entities missing required position data or trip_id
+                # before building anything, so discarded vehicles never pay
+                # for the nested output dict
+                latitude = position.get('latitude')
+                longitude = position.get('longitude')
+                trip_id = trip_info.get('tripId')
+                if latitude is None or longitude is None or trip_id is None:
+                    continue
+
+                deviation = trip_deviations.get(trip_id)
+                deviation_values.append(float(deviation) if deviation is not None else np.nan)
+
+                vehicle_descriptor = vehicle.get('vehicle', {})
+                vehicle_positions.append({
+                    'id': vehicle_descriptor.get('id'),
+                    'label': vehicle_descriptor.get('label'),
+                    'position': {
+                        'latitude': latitude,
+                        'longitude': longitude,
+                        'bearing': position.get('bearing'),
+                        'speed': position.get('speed')
+                    },
+                    'currentStatus': vehicle.get('currentStatus'),
+                    'stopId': vehicle.get('stopId'),
+                    'congestionLevel': vehicle.get('congestionLevel'),
+                    'occupancyStatus': vehicle.get('occupancyStatus'),
+                    'trip': {
+                        'tripId': trip_id,
+                        'routeId': trip_info.get('routeId'),
+                        'directionId': trip_info.get('directionId')
+                    },
+                    'scheduleDeviation': deviation # None when no trip update reported one
+                })
         else:
             logger.warning("'entity' key not found in vehicle_positions_data or is empty.")
 
         # logger.info(f"Extracted {len(vehicle_positions)} vehicles with position and trip_id from Vehicle Positions feed.") # Reduced log
 
-        # --- Extract Schedule Deviations from Trip Updates ---
-        trip_deviations = {} # Map trip_id to deviation
-        if 'entity' in trip_updates_data:
-            # logger.info(f"Found {len(trip_updates_data.get('entity', []))} entities in Trip Updates feed.") # Reduced log
-            # Log a few sample trip update entities to inspect structure
-            # for i, entity in enumerate(trip_updates_data['entity'][:5]): # Reduced log
-            #     if 'tripUpdate' in entity: # Reduced log
-            #         logger.info(f"Sample Trip Update Entity {i}: {json.dumps(entity.get('tripUpdate'), indent=2)}") # Reduced log
-
-            for entity in trip_updates_data['entity']:
-                if 'tripUpdate' in entity:
-                    trip_update = entity['tripUpdate']
-                    trip_info_rt = trip_update.get('trip', {})
-                    trip_id = trip_info_rt.get('tripId')
-
-                    # Find the latest schedule deviation from stop time updates
-                    deviation = None
-                    if 'stopTimeUpdate' in trip_update:
-                        stop_time_updates = sorted(trip_update['stopTimeUpdate'], key=lambda x: x.get('stopSequence', 0))
-                        for stop_time_update in reversed(stop_time_updates):
-                            if 'scheduleDeviation' in stop_time_update:
-                                reported_deviation = stop_time_update['scheduleDeviation']
-                                try:
-                                    deviation = int(reported_deviation)
-                                    break
-                                except (ValueError, TypeError):
-                                    logger.warning(f"Could not convert reported scheduleDeviation {reported_deviation} to integer for trip {trip_id}.")
-                                    deviation = None
-                            # If scheduleDeviation is not present, check for 'delay' nested within arrival or departure
-                            elif 'arrival' in stop_time_update and 'delay' in stop_time_update['arrival']:
-                                reported_delay = stop_time_update['arrival']['delay']
-                                try:
-                                    deviation = int(reported_delay)
-                                    break
-                                except (ValueError, TypeError):
-                                    logger.warning(f"Could not convert reported delay in arrival object {reported_delay} to integer for trip {trip_id}.")
-                                    deviation = None
-                            elif 'departure' in stop_time_update and 'delay' in stop_time_update['departure']:
-                                reported_delay = stop_time_update['departure']['delay']
-                                try:
-                                    deviation = int(reported_delay)
-                                    break
-                                except (ValueError, TypeError):
-                                    logger.warning(f"Could not convert reported delay in departure object {reported_delay} to integer for trip {trip_id}.")
-                                    deviation = None
-
-                    if trip_id is not None and deviation is not None:
-                        trip_deviations[trip_id] = deviation
-        else:
-            logger.warning("'entity' key not found in trip_updates_data or is empty.")
-
         # logger.info(f"Extracted {len(trip_deviations)} schedule deviations from Trip Updates feed.") # Reduced log
         # Log the extracted deviations to inspect
         # logger.info(f"Extracted Deviations (first 10): {list(trip_deviations.items())[:10]}") # Reduced log
 
-        # --- Merge Vehicle Positions with Schedule Deviations ---
-        merged_vehicles = []
-        total_vehicles_with_deviation = 0
-        on_time_vehicles = 0
-        total_early_deviation = 0
-        total_late_deviation = 0
-        early_vehicles_count = 0
-        late_vehicles_count = 0
-        vehicles_with_deviation_list = [] # List to store vehicles that received deviation
-
-        # Define the on-time window in seconds
-        ON_TIME_EARLY_THRESHOLD = -60
-        ON_TIME_LATE_THRESHOLD = 300
-
-        for vehicle in vehicle_positions:
-            trip_id = vehicle['trip']['tripId']
-            if trip_id in trip_deviations:
-                deviation = trip_deviations[trip_id]
-                vehicle['scheduleDeviation'] = deviation
-
-                # Calculate metrics
-                total_vehicles_with_deviation += 1
-                if deviation >= ON_TIME_EARLY_THRESHOLD and deviation <= ON_TIME_LATE_THRESHOLD:
-                    on_time_vehicles += 1
-                elif deviation < ON_TIME_EARLY_THRESHOLD:
-                    total_early_deviation += abs(deviation)
-                    early_vehicles_count += 1
-                elif deviation > ON_TIME_LATE_THRESHOLD:
-                    total_late_deviation += deviation
-                    late_vehicles_count += 1
-                vehicles_with_deviation_list.append(vehicle) # Add vehicle to list if it got a deviation
-
-            merged_vehicles.append(vehicle)
-
-        # logger.info(f"Attempted to merge deviations with {len(vehicle_positions)} vehicle positions.") # Reduced log
-        # logger.info(f"Successfully merged deviation for {total_vehicles_with_deviation} vehicles.") # Reduced log
+        merged_vehicles = vehicle_positions
+        devs = np.asarray(deviation_values, dtype=np.float64)
 
         # --- Calculate Real-time Performance Metrics ---
-        # Ensure calculations use only vehicles that received a deviation
-        early_deviations = [v['scheduleDeviation'] for v in vehicles_with_deviation_list if v.get('scheduleDeviation') is not None and v['scheduleDeviation'] < ON_TIME_EARLY_THRESHOLD]
-        late_deviations = [v['scheduleDeviation'] for v in vehicles_with_deviation_list if v.get('scheduleDeviation') is not None and v['scheduleDeviation'] > ON_TIME_LATE_THRESHOLD]
+        on_time_vehicles, early_vehicles_count, late_vehicles_count, \
+            sum_early_abs, sum_late, sum_all = classify_deviations(devs)
+        total_vehicles_with_deviation = on_time_vehicles + early_vehicles_count + late_vehicles_count
 
         on_time_percentage = (on_time_vehicles / total_vehicles_with_deviation * 100) if total_vehicles_with_deviation > 0 else 0
-        average_early_deviation = (sum(abs(dev) for dev in early_deviations) / len(early_deviations)) if early_deviations else 0
-        average_late_deviation = (sum(late_deviations) / len(late_deviations)) if late_deviations else 0
-        average_overall_deviation = (sum(v['scheduleDeviation'] for v in vehicles_with_deviation_list if v.get('scheduleDeviation') is not None) / total_vehicles_with_deviation) if total_vehicles_with_deviation > 0 else 0
+        average_early_deviation = (sum_early_abs / early_vehicles_count) if early_vehicles_count > 0 else 0
+        average_late_deviation = (sum_late / late_vehicles_count) if late_vehicles_count > 0 else 0
+        average_overall_deviation = (sum_all / total_vehicles_with_deviation) if total_vehicles_with_deviation > 0 else 0
 
         realtime_metrics = {
             "total_vehicles_reporting_deviation": int(total_vehicles_with_deviation),
@@ -358,7 +598,7 @@ async def get_realtime_vehicles():
         # --- Fetch and Process Service Alerts ---
         alerts = []
         if service_alerts_data and 'entity' in service_alerts_data:
-            logger.info(f"Found {len(service_alerts_data.get('entity', []))} entities in Service Alerts feed.")
+            logger.info("Found %d entities in Service Alerts feed.", len(service_alerts_data.get('entity', [])))
             for entity in service_alerts_data['entity']:
                 if 'alert' in entity:
                     alert = entity['alert']
@@ -367,18 +607,18 @@ async def get_realtime_vehicles():
                         'id': entity.get('id'),
                         'cause': alert.get('cause'),
                         'effect': alert.get('effect'),
-                        'url': alert.get('url', {}).get('translation', [{}])[0].get('text') if alert.get('url') else None,
-                        'headerText': alert.get('headerText', {}).get('translation', [{}])[0].get('text') if alert.get('headerText') else None,
-                        'descriptionText': alert.get('descriptionText', {}).get('translation', [{}])[0].get('text') if alert.get('descriptionText') else None,
+                        'url': _translated_text(alert, 'url'),
+                        'headerText': _translated_text(alert, 'headerText'),
+                        'descriptionText': _translated_text(alert, 'descriptionText'),
                         'informedEntities': alert.get('informedEntity', []) # List of affected entities
                     }
                     alerts.append(alert_info)
         else:
             logger.warning("'entity' key not found in service_alerts_data or is empty.")
 
-        logger.info(f"Extracted {len(alerts)} service alerts.")
+        logger.info("Extracted %d service alerts.", len(alerts))
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "success",
                 "timestamp": realtime_timestamp,
@@ -395,7 +635,7 @@ async def get_realtime_vehicles():
         )
 
     except Exception as e:
-        logger.error(f"An error occurred in get_realtime_vehicles: {e}\n{traceback.format_exc()}")
+        logger.exception("An error occurred in get_realtime_vehicles")
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {e}")
 
 @router.get("/routes/geometry")
@@ -404,12 +644,17 @@ async def get_route_geometry():
     Get static GTFS route geometry and colors from the last validated feed.
     """
     global last_validated_feed # Declare use of global variable
-    
+    global _geojson_cache
+
     if last_validated_feed is None:
         raise HTTPException(status_code=404, detail="No GTFS feed has been validated yet.")
 
     feed = last_validated_feed
 
+    # Serve the pre-serialized GeoJSON if it was built from this same feed
+    if _geojson_cache is not None and _geojson_cache[0] == id(feed):
+        return Response(content=_geojson_cache[1], media_type="application/json")
+
     # Check if required files are in the feed
     if not hasattr(feed, 'routes') or feed.routes is None or feed.routes.empty or \
        not hasattr(feed, 'shapes') or feed.shapes is None or feed.shapes.empty or \
@@ -425,58 +670,43 @@ async def get_route_geometry():
         trips_df = feed.trips
 
         # Create a mapping from shape_id to route information using trips.txt
-        # This handles cases where multiple trips use the same shape
+        # This handles cases where multiple trips use the same shape.
+        # Deduplicate trips to one row per shape_id up front and resolve route
+        # info through a plain dict, instead of materializing a full
+        # trips-routes merge that gets collapsed straight back down anyway.
+        # The first trip encountered for a shape wins, assuming consistent
+        # route info per shape.
+        # drop_duplicates keeps the endpoint working on feeds with repeated
+        # route_id rows (set_index alone would raise); first row wins, same
+        # as the merge this replaced
+        route_map = (routes_df.drop_duplicates('route_id')
+                     .set_index('route_id')[['route_color', 'route_short_name']].to_dict('index'))
+        trips_unique = trips_df.drop_duplicates('shape_id', keep='first')[['shape_id', 'route_id']]
+
         shape_to_route_info = {}
-        # Merge trips and routes to easily get route info for each trip's shape
-        trips_with_route_info = pd.merge(
-            trips_df[['trip_id', 'route_id', 'shape_id']],
-            routes_df[['route_id', 'route_color', 'route_short_name']],
-            on='route_id',
-            how='left'
-        )
-        
-        # Iterate through trips_with_route_info and build the shape_to_route_info map
-        # Prioritize the first trip encountered for a given shape_id, assuming consistent route info per shape
-        for _, row in trips_with_route_info.iterrows():
-            shape_id = row.get('shape_id')
-            route_color = row.get('route_color')
-            route_short_name = row.get('route_short_name')
-
-            if shape_id is not None and shape_id not in shape_to_route_info:
-                 shape_to_route_info[shape_id] = {
-                    'route_id': row.get('route_id'),
-                    'route_color': route_color if pd.notna(route_color) else None,
-                    'route_short_name': route_short_name if pd.notna(route_short_name) else None
-                }
+        for shape_id, route_id in trips_unique.itertuples(index=False, name=None):
+            if pd.isna(shape_id):
+                continue
+            route_info = route_map.get(route_id, {})
+            route_color = route_info.get('route_color')
+            route_short_name = route_info.get('route_short_name')
+            shape_to_route_info[shape_id] = {
+                'route_id': route_id,
+                # Normalize once per route here rather than once per shape below;
+                # the memoized helper makes repeats a dict hit
+                'route_color': _normalize_route_color(route_color if pd.notna(route_color) else None),
+                'route_short_name': route_short_name if pd.notna(route_short_name) else None
+            }
 
         # Create a GeoJSON FeatureCollection
         features = []
 
-        # Group shapes by shape_id
-        # Use iterrows for pandas DataFrame iteration
-        for shape_id, shape_group in shapes_df.groupby('shape_id'):
-            # Sort by shape_pt_sequence
-            shape_group = shape_group.sort_values('shape_pt_sequence')
-
-            # Create LineString coordinates
-            coordinates = [[row['shape_pt_lon'], row['shape_pt_lat']]
-                           for _, row in shape_group.iterrows()]
-
-            # Get route information for the current shape_id
+        # Build each shape's LineString via one global sort + numpy slicing
+        for shape_id, coordinates in iter_shape_coordinates(shapes_df):
+            # Get route information for the current shape_id; route_color was
+            # already normalized when the map was built
             route_info = shape_to_route_info.get(shape_id, {})
-
-            # Format route color - ensure it starts with # and is a valid hex color
-            route_color = route_info.get('route_color')
-            if route_color and pd.notna(route_color):
-                # Remove any existing # prefix
-                route_color = str(route_color).strip('#')
-                # Ensure it's a valid hex color (6 characters)
-                if len(route_color) == 6:
-                    route_color = f"#{route_color}"
-                else:
-                    route_color = "#000000"  # Default to black if invalid
-            else:
-                route_color = "#000000"  # Default to black if no color
+            route_color = route_info.get('route_color', "#000000")
 
             # Create feature
             feature = {
@@ -499,10 +729,13 @@ async def get_route_geometry():
             "features": features
         }
 
-        return JSONResponse(content=geojson)
+        # Serialize once with orjson and cache the bytes for subsequent requests
+        content = orjson.dumps(geojson)
+        _geojson_cache = (id(feed), content)
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
-        logger.error(f"An error occurred while generating route geometry: {e}\n{traceback.format_exc()}")
+        logger.exception("An error occurred while generating route geometry")
         raise HTTPException(status_code=500, detail=f"Internal Server Error while processing route geometry: {e}")
 
 @router.post("/routes/geometry/url")
@@ -529,16 +762,9 @@ async def get_route_geometry_from_url(url: str):
             
             # Create a GeoJSON FeatureCollection
             features = []
-            
-            # Group shapes by shape_id
-            for shape_id, shape_group in shapes_df.groupby('shape_id'):
-                # Sort by shape_pt_sequence
-                shape_group = shape_group.sort_values('shape_pt_sequence')
-                
-                # Create LineString coordinates
-                coordinates = [[row['shape_pt_lon'], row['shape_pt_lat']] 
-                             for _, row in shape_group.iterrows()]
-                
+
+            # Build each shape's LineString via one global sort + numpy slicing
+            for shape_id, coordinates in iter_shape_coordinates(shapes_df):
                 # Find matching route
                 route_info = routes_df[routes_df['route_id'] == shape_id].iloc[0] if not routes_df[routes_df['route_id'] == shape_id].empty else None
                 
@@ -561,13 +787,13 @@ async def get_route_geometry_from_url(url: str):
                 "type": "FeatureCollection",
                 "features": features
             }
-            
-            return geojson
-            
+
+            return ORJSONResponse(content=geojson)
+
     except HTTPException as he:
         raise he
     except Exception as e:
-        logger.error(f"An error occurred while generating route geometry from URL: {str(e)}")
+        logger.exception("An error occurred while generating route geometry from URL")
         raise HTTPException(status_code=500, detail=str(e)) 
 
 @router.get("/report")
@@ -581,30 +807,48 @@ async def get_validation_report(format: str = "json"):
     feed = last_validated_feed
 
     try:
-        # Assume validation_results are stored or can be regenerated quickly from the stored feed
-        # For simplicity, we'll just regenerate the report structure here.
-        # In a more complex app, you might store the validation_results too.
-        validator = GTFSValidator()
-        # Note: This re-runs validation, which might be slow. A better approach for a production app
-        # would be to store the results after the initial validation.
-        validation_results = validator.validate_feed(feed)
-
-        report_generator = GTFSReportGenerator(feed)
-        report = report_generator.generate_report(validation_results)
+        # Serve the memoized report when the persisted feed hasn't changed;
+        # only re-run validation on a cache miss (e.g. after a server restart).
+        cache_key = _feed_cache_key(UPLOAD_DIR / "current_feed.zip")
+        cached = _report_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            validation_results, report = cached
+        else:
+            # Validation and report generation are blocking pandas work;
+            # run them off the event loop so concurrent requests aren't
+            # stalled behind this miss
+            def _build():
+                validator = GTFSValidator()
+                validation_results = validator.validate_feed(feed)
+                report = GTFSReportGenerator(feed).generate_report(validation_results)
+                return validation_results, report
+
+            validation_results, report = await asyncio.to_thread(_build)
+            _store_report_cache(cache_key, validation_results, report)
 
         if format.lower() == "csv":
-            csv_content = report_generator.export_csv(report)
+            csv_content = _csv_cache.get(cache_key) if cache_key is not None else None
+            if csv_content is not None:
+                # Cached export: serve the pre-built document as one chunk
+                body = iter([csv_content])
+            elif cache_key is None:
+                # Nothing to key a cache entry on; just stream row by row
+                body = GTFSReportGenerator(feed).iter_csv_rows(report)
+            else:
+                csv_content = GTFSReportGenerator(feed).export_csv(report)
+                _csv_cache[cache_key] = csv_content
+                body = iter([csv_content])
             return StreamingResponse(
-                iter([csv_content]),
+                body,
                 media_type="text/csv",
                 headers={"Content-Disposition": f"attachment; filename=validation_report.csv"}
             )
 
         # Default to JSON
-        return JSONResponse(content=report)
+        return ORJSONResponse(content=report)
 
     except Exception as e:
-        logger.error(f"An error occurred while generating report: {e}\n{traceback.format_exc()}")
+        logger.exception("An error occurred while generating report")
         raise HTTPException(status_code=500, detail=f"Internal Server Error while generating report: {e}") 
 
 @router.get("/stops/geometry")
@@ -624,34 +868,56 @@ async def get_stop_geometry():
     try:
         stops_df = feed.stops
 
-        # Create a GeoJSON FeatureCollection for stops
-        features = []
-        for _, stop in stops_df.iterrows():
-            # Ensure required fields exist and are not None
-            if pd.notna(stop['stop_lon']) and pd.notna(stop['stop_lat']):
-                 feature = {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [float(stop['stop_lon']), float(stop['stop_lat'])] # Ensure floats
-                    },
-                    "properties": {
-                        "stop_id": stop.get('stop_id') if pd.notna(stop.get('stop_id')) else None,
-                        "stop_code": stop.get('stop_code') if pd.notna(stop.get('stop_code')) else None,
-                        "stop_name": stop.get('stop_name') if pd.notna(stop.get('stop_name')) else None,
-                        "stop_desc": stop.get('stop_desc') if pd.notna(stop.get('stop_desc')) else None,
-                        # Add other relevant stop fields as needed, remember to handle NA/NaN
-                    }
+        # Create a GeoJSON FeatureCollection for stops.
+        # One vectorized pass per column instead of per-row checks: drop rows
+        # without coordinates, bulk-convert the coordinate columns to float,
+        # and materialize each property column once with NaN replaced by None.
+        # The feature loop then just zips precomputed lists.
+        sub = stops_df.dropna(subset=['stop_lon', 'stop_lat'])
+        # tolist() converts the whole buffer to native Python floats in one
+        # C loop, instead of a float() call per coordinate in the zip below
+        lons = sub['stop_lon'].to_numpy(dtype='float64').tolist()
+        lats = sub['stop_lat'].to_numpy(dtype='float64').tolist()
+
+        prop_cols = ('stop_id', 'stop_code', 'stop_name', 'stop_desc')
+        prop_values = {}
+        for col in prop_cols:
+            if col in sub.columns:
+                # astype(object) first so the None survives even on numeric
+                # columns (e.g. an all-digit stop_code read as float), where
+                # where() would otherwise coerce it back to NaN
+                prop_values[col] = sub[col].astype(object).where(sub[col].notna(), None).tolist()
+            else:
+                prop_values[col] = [None] * len(sub)
+
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [lon, lat]
+                },
+                "properties": {
+                    "stop_id": stop_id,
+                    "stop_code": stop_code,
+                    "stop_name": stop_name,
+                    "stop_desc": stop_desc,
+                    # Add other relevant stop fields as needed, remember to handle NA/NaN
                 }
-                 features.append(feature)
+            }
+            for lon, lat, stop_id, stop_code, stop_name, stop_desc in zip(
+                lons, lats,
+                prop_values['stop_id'], prop_values['stop_code'],
+                prop_values['stop_name'], prop_values['stop_desc'])
+        ]
 
         geojson = {
             "type": "FeatureCollection",
             "features": features
         }
 
-        return JSONResponse(content=geojson)
+        return ORJSONResponse(content=geojson)
 
     except Exception as e:
-        logger.error(f"An error occurred while generating stop geometry: {e}\n{traceback.format_exc()}")
+        logger.exception("An error occurred while generating stop geometry")
         raise HTTPException(status_code=500, detail=f"Internal Server Error while processing stop geometry: {e}") 
\ No newline at end of file
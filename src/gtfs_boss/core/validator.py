@@ -1,9 +1,71 @@
 from typing import List, Dict, Any
+import copy
+import weakref
+from collections import OrderedDict
 import gtfs_kit as gk
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+# Required GTFS files as (filename, feed attribute) pairs, resolved once at
+# import time instead of a .replace() per file per validation call
+REQUIRED_FILES = (
+    ("agency.txt", "agency"),
+    ("stops.txt", "stops"),
+    ("routes.txt", "routes"),
+    ("trips.txt", "trips"),
+    ("stop_times.txt", "stop_times"),
+)
+_REQUIRED_ATTRS = frozenset(attr for _, attr in REQUIRED_FILES)
+
+# Sentinel distinguishing a missing feed attribute from one set to None
+_MISSING = object()
+
+# Validation results keyed by feed fingerprint. Feeds change rarely relative
+# to how often they are validated, so re-serving a cached result turns repeat
+# calls into dict lookups. Results are deep-copied on the way out so callers
+# can't mutate the cached copy. Each entry carries a weakref to the feed it
+# was computed from: id(feed) in the fingerprint can be recycled once a feed
+# is garbage-collected, so a hit only counts when the referent is still the
+# same live object (without the weakref pinning feeds in memory).
+_VALIDATION_CACHE_SIZE = 32
+_validation_cache: "OrderedDict[tuple, tuple[weakref.ref, Dict[str, Any]]]" = OrderedDict()
+
+def _check_coords(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Boolean mask of coordinates outside WGS84 range.
+
+    Pure-ndarray kernel: callers do the DataFrame-to-array conversion, so
+    everything here runs in numpy's C loops and the function stays trivially
+    jittable should a compiled path ever be warranted.
+    """
+    return (np.abs(lat) > 90) | (np.abs(lon) > 180)
+
+def _check_references(values: pd.Series, valid: np.ndarray) -> "pd.Series":
+    """Boolean mask marking rows of ``values`` present in ``valid``.
+
+    One hash-table membership scan in C; callers test ``.all()`` before
+    materializing any offending ids.
+    """
+    return values.isin(valid)
+
+def _has_col(feed: gk.Feed, attr: str, col: str) -> bool:
+    """True when the feed table exists, has rows, and carries the column."""
+    df = getattr(feed, attr, None)
+    return df is not None and isinstance(df, pd.DataFrame) and len(df) != 0 and col in df.columns
+
+def _feed_fingerprint(feed: gk.Feed) -> tuple:
+    """Cheap identity for a parsed feed: object id plus the table shapes."""
+    parts: List[Any] = [id(feed)]
+    for attr in ('agency', 'stops', 'routes', 'trips', 'stop_times', 'calendar', 'calendar_dates'):
+        df = getattr(feed, attr, None)
+        parts.append(df.shape if isinstance(df, pd.DataFrame) else None)
+    return tuple(parts)
+
 class GTFSValidator:
+    # The validator is instantiated per request; slots skip the per-instance
+    # __dict__ allocation
+    __slots__ = ("errors", "warnings")
+
     def __init__(self):
         self.errors: List[Dict[str, Any]] = []
         self.warnings: List[Dict[str, Any]] = []
@@ -19,23 +81,39 @@ class GTFSValidator:
             Dict containing validation results including errors and warnings
         """
         try:
+            # Serve repeat validations of an unchanged feed from the cache
+            fingerprint = _feed_fingerprint(feed)
+            entry = _validation_cache.get(fingerprint)
+            if entry is not None:
+                feed_ref, cached = entry
+                if feed_ref() is feed:
+                    _validation_cache.move_to_end(fingerprint)
+                    return copy.deepcopy(cached)
+                # id(feed) was recycled by a different feed object; the
+                # stale entry must not be served
+                del _validation_cache[fingerprint]
+
             # Reset validation state
             self.errors = []
             self.warnings = []
-            
+
             # Validate required files
             self._validate_required_files(feed)
-            
+
             # Only run these validations if we have the required files
             if len(self.errors) == 0:
                 self._validate_foreign_keys(feed)
                 self._validate_coordinates(feed)
-            
-            return {
+
+            result = {
                 "is_valid": len(self.errors) == 0,
                 "errors": self.errors,
                 "warnings": self.warnings
             }
+            _validation_cache[fingerprint] = (weakref.ref(feed), copy.deepcopy(result))
+            while len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+                _validation_cache.popitem(last=False)
+            return result
         except Exception as e:
             return {
                 "is_valid": False,
@@ -45,75 +123,67 @@ class GTFSValidator:
 
     def _validate_required_files(self, feed: gk.Feed) -> None:
         """Check for required GTFS files."""
-        required_files = ["agency.txt", "stops.txt", "routes.txt", "trips.txt", "stop_times.txt"]
-        
-        for file in required_files:
-            attr_name = file.replace(".txt", "")
-            if not hasattr(feed, attr_name):
+        # Preprocessed feeds (utils.feed_loader.preprocess_feed) carry the
+        # inventory of present non-empty tables; when every required table
+        # is in it, the per-attribute probes below can be skipped entirely.
+        # A feed that fails the fast check still takes the detailed pass so
+        # the error distinguishes missing from empty from invalid.
+        meta = getattr(feed, "_gtfs_boss_meta", None)
+        if meta is not None:
+            present = meta.get("present_files")
+            if present is not None and _REQUIRED_ATTRS <= present:
+                return
+
+        for file, attr_name in REQUIRED_FILES:
+            # One attribute probe per file; the sentinel separates a missing
+            # attribute from one explicitly set to None
+            file_data = getattr(feed, attr_name, _MISSING)
+            if file_data is _MISSING:
                 self.errors.append({
                     "type": "missing_file",
                     "file": file,
                     "message": f"Required file {file} is missing"
                 })
-            else:
-                # Check if the file exists but is None or empty
-                file_data = getattr(feed, attr_name)
-                if file_data is None:
+            elif file_data is None:
+                self.errors.append({
+                    "type": "empty_file",
+                    "file": file,
+                    "message": f"Required file {file} is empty or invalid"
+                })
+            elif isinstance(file_data, pd.DataFrame):
+                if len(file_data) == 0:
                     self.errors.append({
                         "type": "empty_file",
                         "file": file,
-                        "message": f"Required file {file} is empty or invalid"
+                        "message": f"Required file {file} contains no data"
                     })
-                elif isinstance(file_data, pd.DataFrame):
-                    if file_data.empty:
-                        self.errors.append({
-                            "type": "empty_file",
-                            "file": file,
-                            "message": f"Required file {file} contains no data"
-                        })
-                elif isinstance(file_data, tuple) and len(file_data) == 2:
-                    # Handle case where file_data is a tuple of (rows, columns)
-                    if file_data[0] == 0:  # No rows
-                        self.errors.append({
-                            "type": "empty_file",
-                            "file": file,
-                            "message": f"Required file {file} contains no data"
-                        })
-                else:
+            elif isinstance(file_data, tuple) and len(file_data) == 2:
+                # Handle case where file_data is a tuple of (rows, columns)
+                if file_data[0] == 0:  # No rows
                     self.errors.append({
-                        "type": "invalid_file",
+                        "type": "empty_file",
                         "file": file,
-                        "message": f"Required file {file} is not a valid DataFrame or tuple"
+                        "message": f"Required file {file} contains no data"
                     })
+            else:
+                self.errors.append({
+                    "type": "invalid_file",
+                    "file": file,
+                    "message": f"Required file {file} is not a valid DataFrame or tuple"
+                })
 
     def _validate_foreign_keys(self, feed: gk.Feed) -> None:
         """Validate foreign key relationships."""
         # Check trip.service_id references against calendar and/or calendar_dates
-        if hasattr(feed, "trips") and feed.trips is not None and not feed.trips.empty:
-            service_ids_in_trips = set(feed.trips.service_id)
-            service_ids_in_calendar = set()
-            service_ids_in_calendar_dates = set()
-            
-            # Check calendar.txt
-            has_calendar = (
-                hasattr(feed, "calendar") and 
-                feed.calendar is not None and 
-                not feed.calendar.empty and 
-                'service_id' in feed.calendar.columns
-            )
-            
-            # Check calendar_dates.txt
-            has_calendar_dates = (
-                hasattr(feed, "calendar_dates") and 
-                feed.calendar_dates is not None and 
-                not feed.calendar_dates.empty and 
-                'service_id' in feed.calendar_dates.columns
-            )
-
-            if has_calendar:
-                service_ids_in_calendar = set(feed.calendar.service_id)
-            if has_calendar_dates:
-                service_ids_in_calendar_dates = set(feed.calendar_dates.service_id)
+        # Feeds that went through utils.feed_loader.preprocess_feed carry
+        # the valid id arrays already; fall back to building them here
+        meta = getattr(feed, "_gtfs_boss_meta", None) or {}
+
+        if hasattr(feed, "trips") and feed.trips is not None and len(feed.trips) != 0:
+            trip_service_ids = feed.trips['service_id']
+
+            has_calendar = _has_col(feed, "calendar", 'service_id')
+            has_calendar_dates = _has_col(feed, "calendar_dates", 'service_id')
 
             # Only raise error if neither calendar nor calendar_dates are present
             if not has_calendar and not has_calendar_dates:
@@ -123,49 +193,65 @@ class GTFSValidator:
                     "message": "Both calendar.txt and calendar_dates.txt are missing or invalid, cannot validate service_id references."
                 })
             else:
-                # Check if all service_ids in trips are present in at least one of the two
-                valid_service_ids = service_ids_in_calendar.union(service_ids_in_calendar_dates)
-                invalid_service_ids = service_ids_in_trips - valid_service_ids
-                if invalid_service_ids:
+                # Check if all service_ids in trips are present in at least
+                # one of the two. Healthy feeds pass, so the hot path is one
+                # C hash-membership scan plus an all(); the offending ids are
+                # only materialized when a violation exists.
+                valid_service_ids = meta.get("valid_service_ids")
+                if valid_service_ids is None:
+                    valid_service_id_parts = []
+                    if has_calendar:
+                        valid_service_id_parts.append(feed.calendar['service_id'].unique())
+                    if has_calendar_dates:
+                        valid_service_id_parts.append(feed.calendar_dates['service_id'].unique())
+                    valid_service_ids = np.concatenate(valid_service_id_parts)
+                mask = _check_references(trip_service_ids, valid_service_ids)
+                if not mask.all():
+                    invalid_service_ids = pd.unique(trip_service_ids[~mask])
                     self.errors.append({
                         "type": "foreign_key",
-                        "message": f"Invalid service_id references in trips.txt: {invalid_service_ids}"
+                        "message": f"Invalid service_id references in trips.txt: {invalid_service_ids.tolist()}"
                     })
 
         # Check trip.route_id references
-        if (hasattr(feed, "trips") and feed.trips is not None and not feed.trips.empty and
-            hasattr(feed, "routes") and feed.routes is not None and not feed.routes.empty and
-            'route_id' in feed.trips.columns and 'route_id' in feed.routes.columns):
-            
-            invalid_route_ids = set(feed.trips.route_id) - set(feed.routes.route_id)
-            if invalid_route_ids:
+        if _has_col(feed, "trips", 'route_id') and _has_col(feed, "routes", 'route_id'):
+            trip_route_ids = feed.trips['route_id']
+            route_ids = meta.get("route_ids")
+            if route_ids is None:
+                route_ids = feed.routes['route_id'].to_numpy()
+            mask = _check_references(trip_route_ids, route_ids)
+            if not mask.all():
+                invalid_route_ids = pd.unique(trip_route_ids[~mask])
                 self.errors.append({
                     "type": "foreign_key",
-                    "message": f"Invalid route_id references in trips.txt: {invalid_route_ids}"
+                    "message": f"Invalid route_id references in trips.txt: {invalid_route_ids.tolist()}"
                 })
 
     def _validate_coordinates(self, feed: gk.Feed) -> None:
         """Validate stop coordinates."""
-        if (hasattr(feed, "stops") and 
-            feed.stops is not None and 
-            not feed.stops.empty and 
-            'stop_lat' in feed.stops.columns and 
-            'stop_lon' in feed.stops.columns and 
-            'stop_id' in feed.stops.columns):
-            
-            # Filter out rows with missing coordinates
-            valid_stops = feed.stops.dropna(subset=['stop_lat', 'stop_lon'])
-            
-            if not valid_stops.empty:
-                invalid_coords = valid_stops[
-                    (valid_stops.stop_lat < -90) | 
-                    (valid_stops.stop_lat > 90) | 
-                    (valid_stops.stop_lon < -180) | 
-                    (valid_stops.stop_lon > 180)
-                ]
-                
-                if not invalid_coords.empty:
-                    self.errors.append({
-                        "type": "coordinates",
-                        "message": f"Invalid coordinates found in stops.txt: {invalid_coords.stop_id.tolist()}"
-                    }) 
\ No newline at end of file
+        if (_has_col(feed, "stops", 'stop_lat') and
+            _has_col(feed, "stops", 'stop_lon') and
+            _has_col(feed, "stops", 'stop_id')):
+
+
+            # Missing coordinates become NaN in the float conversion and NaN
+            # fails every range comparison, so rows without coordinates are
+            # skipped by the mask itself — no dropna copy of the whole stops
+            # table is needed
+            lat = feed.stops['stop_lat'].to_numpy(dtype='float64')
+            lon = feed.stops['stop_lon'].to_numpy(dtype='float64')
+            mask = _check_coords(lat, lon)
+
+            n_invalid = int(mask.sum())
+            if n_invalid:
+                # Pull the ids straight off the numpy array and cap the
+                # listing — the message is for humans, and a feed full of
+                # 0,0 sentinels would otherwise enumerate every stop
+                invalid_stop_ids = feed.stops['stop_id'].to_numpy()[np.flatnonzero(mask)[:100]].tolist()
+                message = f"Invalid coordinates found in stops.txt: {invalid_stop_ids}"
+                if n_invalid > 100:
+                    message += f" (first 100 of {n_invalid})"
+                self.errors.append({
+                    "type": "coordinates",
+                    "message": message
+                }) 
\ No newline at end of file
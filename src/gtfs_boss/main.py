@@ -4,8 +4,9 @@ import traceback
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+import orjson
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from gtfs_boss.api import validation
 
@@ -48,13 +49,17 @@ async def exception_handler(request: Request, exc: Exception):
         }
     )
 
+# The root payload never changes, so serialize it once at import time and
+# hand the bytes back per request instead of re-encoding for every poll
+_ROOT_RESPONSE = orjson.dumps({
+    "message": "Welcome to GTFS Boss",
+    "version": "1.0.0",
+    "status": "running"
+})
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Welcome to GTFS Boss",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(content=_ROOT_RESPONSE, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
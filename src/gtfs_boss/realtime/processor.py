@@ -1,15 +1,25 @@
 import logging
+import httpx
 import requests
 # from google.protobuf.json_format import MessageToJson # Not needed
 # from google.protobuf.message import Message # Not needed
-import json # Use standard json library for direct JSON parsing
+import orjson # C JSON parser; takes bytes directly, skipping the UTF-8 decode
+from concurrent.futures import ThreadPoolExecutor
 # from google.transit import gtfs_realtime_pb2 # Not needed if parsing directly
 # from google.protobuf.json_format import MessageToDict # Not needed if parsing directly
-import traceback # Import traceback for detailed error logging
 
-logging.basicConfig(level=logging.INFO)
+# Logging configuration belongs to the entrypoint (main.py); this module
+# only emits records, with %s placeholders so arguments are formatted
+# lazily on the hot polling path
 logger = logging.getLogger(__name__)
 
+# Shared session with a connection pool so each poll reuses a keep-alive
+# connection instead of paying a fresh TCP/TLS handshake
+_SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 def fetch_and_parse_realtime_feed(feed_url: str) -> dict | None:
     """
     Fetches a GTFS Realtime feed from a URL and parses it as JSON.
@@ -21,30 +31,81 @@ def fetch_and_parse_realtime_feed(feed_url: str) -> dict | None:
         A dictionary containing the parsed feed data, or None if fetching or parsing fails.
     """
     try:
-        logger.info(f"Fetching realtime feed from {feed_url}")
-        response = requests.get(feed_url)
+        logger.info("Fetching realtime feed from %s", feed_url)
+        response = _SESSION.get(feed_url, timeout=30)
         response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
+
+        logger.info("Response status code: %s", response.status_code)
+        logger.info("Response content type: %s", response.headers.get('content-type'))
         
-        logger.info(f"Response status code: {response.status_code}")
-        logger.info(f"Response content type: {response.headers.get('content-type')}")
-        
-        # Parse the response content directly as JSON since asJson=true is used
-        feed_data = json.loads(response.text)
-        
+        # Parse the response bytes directly as JSON since asJson=true is used
+        feed_data = orjson.loads(response.content)
+
         logger.info("Successfully parsed JSON response")
-        
+
         return feed_data
-        
+
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch realtime feed: {str(e)}")
+        logger.error("Failed to fetch realtime feed: %s", e)
         return None
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode JSON response: {e}")
-        logger.error(f"Raw response content that failed parsing:\n{response.text[:500]}...") # Log first 500 chars
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to decode JSON response: %s", e)
+        logger.error("Raw response content that failed parsing:\n%s...", response.text[:500]) # Log first 500 chars
         return None
-    except Exception as e:
+    except Exception:
         # Log any other unexpected errors with traceback
-        logger.error(f"An unexpected error occurred during feed processing: {e}\n{traceback.format_exc()}")
+        logger.exception("An unexpected error occurred during feed processing")
+        return None
+
+def fetch_many(urls: list[str]) -> list[dict | None]:
+    """
+    Fetch and parse several realtime feeds concurrently.
+
+    The fetches are IO-bound, so a small thread pool overlaps the network
+    waits; results come back in the same order as the input URLs.
+    """
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+        return list(pool.map(fetch_and_parse_realtime_feed, urls))
+
+# Shared async HTTP client so concurrent fetches reuse keep-alive connections
+# instead of paying a TCP/TLS handshake per request.
+_async_client: httpx.AsyncClient | None = None
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient, creating it lazily."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(timeout=30.0)
+    return _async_client
+
+async def fetch_and_parse_realtime_feed_async(feed_url: str) -> dict | None:
+    """
+    Async variant of fetch_and_parse_realtime_feed, suitable for fetching
+    several GTFS Realtime feeds concurrently with asyncio.gather.
+
+    Args:
+        feed_url: The URL of the GTFS Realtime feed.
+
+    Returns:
+        A dictionary containing the parsed feed data, or None if fetching or parsing fails.
+    """
+    try:
+        response = await get_async_client().get(feed_url)
+        response.raise_for_status()
+
+        # Parse the response bytes directly as JSON since asJson=true is used
+        return orjson.loads(response.content)
+
+    except httpx.HTTPError as e:
+        logger.error("Failed to fetch realtime feed: %s", e)
+        return None
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to decode JSON response: %s", e)
+        return None
+    except Exception:
+        logger.exception("An unexpected error occurred during feed processing")
         return None
 
 # Removed example usage block
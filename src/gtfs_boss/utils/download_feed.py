@@ -13,16 +13,17 @@ def download_gtfs_feed(url: str, output_path: str) -> str:
     Returns:
         Path to the downloaded feed
     """
-    response = requests.get(url)
-    response.raise_for_status()
-    
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Save the file
-    with open(output_path, 'wb') as f:
-        f.write(response.content)
-    
+
+    # Stream the response to disk in 1 MiB chunks so peak memory stays
+    # bounded regardless of feed size and disk writes overlap the download
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        with open(output_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+
     return output_path
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+import logging
+import pickle
+from pathlib import Path
+
+import gtfs_kit as gk
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Tables the preprocessing pass inventories
+_GTFS_TABLES = (
+    'agency', 'stops', 'routes', 'trips', 'stop_times', 'calendar',
+    'calendar_dates', 'shapes', 'transfers', 'pathways', 'levels',
+    'fare_attributes', 'feed_info',
+)
+
+def preprocess_feed(feed: gk.Feed) -> gk.Feed:
+    """
+    Precompute validation metadata on a freshly loaded feed.
+
+    Attaches ``feed._gtfs_boss_meta`` holding the set of present non-empty
+    tables and the valid service/route id arrays, so the validator can use
+    them directly instead of rebuilding per call. Safe to call more than
+    once; the metadata is simply recomputed.
+    """
+    present = set()
+    for attr in _GTFS_TABLES:
+        df = getattr(feed, attr, None)
+        if isinstance(df, pd.DataFrame) and len(df) != 0:
+            present.add(attr)
+
+    meta = {"present_files": frozenset(present)}
+
+    service_id_parts = []
+    for attr in ('calendar', 'calendar_dates'):
+        if attr in present and 'service_id' in getattr(feed, attr).columns:
+            service_id_parts.append(getattr(feed, attr)['service_id'].unique())
+    if service_id_parts:
+        meta["valid_service_ids"] = np.concatenate(service_id_parts)
+
+    if 'routes' in present and 'route_id' in feed.routes.columns:
+        meta["route_ids"] = feed.routes['route_id'].to_numpy()
+
+    feed._gtfs_boss_meta = meta
+    return feed
+
+def load_feed_cached(zip_path: str | Path, dist_units: str = "km") -> gk.Feed:
+    """
+    Load a GTFS feed, serving repeat loads from a pickle sidecar.
+
+    Parsing the CSVs inside the ZIP takes seconds on large feeds; a pickled
+    Feed deserializes in a fraction of that. The sidecar lives next to the
+    ZIP as <name>.zip.pkl and is rebuilt whenever the ZIP's mtime or size
+    changes.
+
+    Args:
+        zip_path: Path to the GTFS feed ZIP
+        dist_units: Distance units passed to gtfs_kit
+
+    Returns:
+        The parsed feed
+    """
+    zip_path = Path(zip_path)
+    pickle_path = zip_path.with_suffix(zip_path.suffix + ".pkl")
+    stat = zip_path.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+    if pickle_path.exists():
+        try:
+            with open(pickle_path, 'rb') as fh:
+                cached_fingerprint, feed = pickle.load(fh)
+            if cached_fingerprint == fingerprint:
+                if getattr(feed, "_gtfs_boss_meta", None) is None:
+                    preprocess_feed(feed)
+                return feed
+        except Exception:
+            logger.exception("Failed to load pickled feed cache; re-parsing %s", zip_path)
+
+    feed = gk.read_feed(str(zip_path), dist_units=dist_units)
+    # Precompute validation metadata before pickling so cached loads carry it
+    preprocess_feed(feed)
+    try:
+        with open(pickle_path, 'wb') as fh:
+            pickle.dump((fingerprint, feed), fh, protocol=5)
+    except Exception:
+        logger.exception("Failed to write pickled feed cache for %s", zip_path)
+    return feed
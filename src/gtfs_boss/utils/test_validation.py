@@ -1,7 +1,7 @@
 from ..core.validator import GTFSValidator
+from .feed_loader import load_feed_cached
 import os
 from pathlib import Path
-import gtfs_kit as gk
 
 def test_validation():
     # Get the path to the sample GTFS feed
@@ -11,16 +11,22 @@ def test_validation():
         "googletransit.zip"
     )
     
-    # Debug: Print feed contents
+    # Debug: Print feed contents. Walk the known GTFS tables explicitly —
+    # dir(feed) also hits gtfs_kit's methods and lazy properties, some of
+    # which are expensive to evaluate just to print.
+    gtfs_tables = (
+        "agency", "stops", "routes", "trips", "stop_times",
+        "calendar", "calendar_dates", "shapes", "fare_attributes",
+        "fare_rules", "frequencies", "transfers", "feed_info",
+    )
     print("\nFeed Contents:")
-    feed = gk.read_feed(feed_path, dist_units="km")
-    for attr in dir(feed):
-        if not attr.startswith('_'):
-            value = getattr(feed, attr)
-            if hasattr(value, 'shape'):
-                print(f"- {attr}: {value.shape}")
-            else:
-                print(f"- {attr}: {value}")
+    feed = load_feed_cached(feed_path, dist_units="km")
+    for attr in gtfs_tables:
+        value = getattr(feed, attr, None)
+        if hasattr(value, 'shape'):
+            print(f"- {attr}: {value.shape}")
+        else:
+            print(f"- {attr}: {value}")
     
     # Create validator and validate feed
     validator = GTFSValidator()